@@ -0,0 +1,92 @@
+"""Per-request overhead of the legacy and cached read paths.
+
+Run from the project root:
+
+    python -m benchmarks.read_paths
+
+Both paths run against the same in-memory SQLite database. Each simulated
+request opens a session, looks up one car by id and reads one page of cars,
+mirroring ``read_car`` followed by ``read_cars``. The legacy path uses a
+session configured like ``SessionLocal``; the cached path uses one configured
+like ``ReadOnlySessionLocal``, including its write-rejecting listeners.
+"""
+import argparse
+import timeit
+from datetime import date
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import database
+import models
+import queries
+
+
+def make_session_factories(rows: int):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    models.Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    read_only_session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    event.listen(read_only_session_factory, "before_flush", database.reject_flush)
+    event.listen(read_only_session_factory, "do_orm_execute",
+                 database.reject_write_statements)
+    with session_factory() as db:
+        db.add_all([
+            models.Car(manufacturer="Toyota", model="Corolla", year=2020, vehicle_type="Sedan",
+                       registration_number=f"WX{i:05d}", purchase_date=date(2020, 1, 1))
+            for i in range(rows)
+        ])
+        db.commit()
+    return session_factory, read_only_session_factory
+
+
+def legacy_request(session_factory, car_id: int, limit: int):
+    with session_factory() as db:
+        db.query(models.Car).filter(models.Car.id == car_id).first()
+        db.query(models.Car).offset(0).limit(limit).all()
+
+
+def cached_request(session_factory, car_id: int, limit: int):
+    with session_factory() as db:
+        db.execute(queries.select_by_id(models.Car.__table__, car_id)).mappings().first()
+        db.execute(queries.select_page(models.Car.__table__, 0, limit)).mappings().all()
+
+
+def measure(request, session_factory, limit: int, number: int, repeat: int) -> float:
+    # Best of ``repeat`` runs, in microseconds per request
+    timings = timeit.repeat(
+        lambda: request(session_factory, 7, limit), number=number, repeat=repeat)
+    return min(timings) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000,
+                        help="Number of cars in the database.")
+    parser.add_argument("--limit", type=int, default=100,
+                        help="Page size of the list query.")
+    parser.add_argument("--number", type=int, default=500,
+                        help="Requests per timing run.")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Timing runs per path; the fastest is reported.")
+    args = parser.parse_args()
+
+    session_factory, read_only_session_factory = make_session_factories(args.rows)
+    # Warm up both paths so statement caches are populated before timing
+    legacy_request(session_factory, 7, args.limit)
+    cached_request(read_only_session_factory, 7, args.limit)
+
+    legacy = measure(legacy_request, session_factory,
+                     args.limit, args.number, args.repeat)
+    cached = measure(cached_request, read_only_session_factory,
+                     args.limit, args.number, args.repeat)
+    print(f"legacy db.query(...)     : {legacy:8.1f} us/request")
+    print(f"cached select() read-only: {cached:8.1f} us/request")
+    print(f"difference               : {legacy - cached:8.1f} us/request "
+          f"({(legacy - cached) / legacy:.0%} less)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -9,4 +10,19 @@ engine = create_engine(URL_DATABASE)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Sessions for endpoints that only read; any attempt to write raises
+ReadOnlySessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@event.listens_for(ReadOnlySessionLocal, "before_flush")
+def reject_flush(session, flush_context, instances):
+    raise InvalidRequestError("Read-only session cannot flush changes.")
+
+
+@event.listens_for(ReadOnlySessionLocal, "do_orm_execute")
+def reject_write_statements(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        raise InvalidRequestError(
+            "Read-only session cannot execute write statements.")
+
 Base = declarative_base()
\ No newline at end of file
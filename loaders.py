@@ -0,0 +1,91 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Iterable, List
+
+import queries
+
+
+# loaders.py
+
+class BatchLoader:
+    """Coalesce concurrent single-id lookups into one ``WHERE id IN (...)`` query.
+
+    At most one query per loader is in flight. A caller that finds no query
+    running becomes the leader and queries straight away, so a lone lookup
+    pays no extra latency. Callers arriving while a query runs queue their
+    ids; when it finishes one of them leads the next query for the whole
+    queue and every waiting caller gets its row (or ``None``). Nothing is
+    cached between batches, so results are never stale.
+
+    ``window`` optionally makes each leader wait that many seconds before
+    querying to collect more ids. It trades added latency on every lookup,
+    and a worker thread held while waiting, for fewer queries; leave it at 0
+    unless fan-out is bursty enough to benefit.
+    """
+
+    def __init__(self, model, session_factory, window: float = 0.0, max_batch_size: int = 500):
+        self.model = model
+        self.session_factory = session_factory
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._condition = threading.Condition()
+        self._pending: Dict[int, Future] = {}
+        self._in_flight = False
+
+    def load(self, key: int):
+        with self._condition:
+            future = self._pending.get(key)
+            if future is None:
+                future = Future()
+                self._pending[key] = future
+            while self._in_flight and not future.done():
+                self._condition.wait()
+            if future.done():
+                return future.result()
+            self._in_flight = True
+
+        try:
+            if self.window > 0:
+                time.sleep(self.window)
+            self._dispatch()
+        finally:
+            with self._condition:
+                self._in_flight = False
+                self._condition.notify_all()
+        return future.result()
+
+    def load_many(self, keys: Iterable[int]) -> List:
+        # Explicit batches bypass the queue and go straight to the database
+        keys = list(dict.fromkeys(keys))
+        rows = self._fetch(keys)
+        return [rows[key] for key in keys if key in rows]
+
+    def _dispatch(self):
+        with self._condition:
+            batch = self._pending
+            self._pending = {}
+
+        try:
+            rows = self._fetch(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+            return
+
+        for key, future in batch.items():
+            future.set_result(rows.get(key))
+
+    def _fetch(self, keys: List[int]) -> Dict[int, object]:
+        rows = {}
+        db = self.session_factory()
+        try:
+            for start in range(0, len(keys), self.max_batch_size):
+                chunk = keys[start:start + self.max_batch_size]
+                result = db.execute(queries.select_by_ids(
+                    self.model.__table__, chunk)).mappings()
+                for row in result:
+                    rows[row['id']] = row
+        finally:
+            db.close()
+        return rows
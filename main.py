@@ -1,7 +1,10 @@
 import models
+import queries
 import schemas
-from fastapi import FastAPI, Depends, HTTPException, Request, status
-from database import engine, SessionLocal
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, status
+from database import engine, SessionLocal, ReadOnlySessionLocal
+from loaders import BatchLoader
+from pricing import RateTable
 from sqlalchemy.orm import Session
 from typing import List
 from fastapi.exceptions import RequestValidationError
@@ -44,6 +47,28 @@ def get_db():
     finally:
         db.close()
 
+# Dependency to get a session for endpoints that never write
+
+
+def get_read_db():
+    db = ReadOnlySessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+# Coalescing loaders for the single-id read endpoints. Lookups arriving while
+# a query is in flight are always batched; LOADER_BATCH_WINDOW adds a wait
+# (in seconds) before each query to collect more ids at the cost of latency.
+LOADER_BATCH_WINDOW = 0.0
+car_loader = BatchLoader(models.Car, ReadOnlySessionLocal,
+                         window=LOADER_BATCH_WINDOW)
+client_loader = BatchLoader(models.Client, ReadOnlySessionLocal,
+                            window=LOADER_BATCH_WINDOW)
+
+# Precomputed daily rates used by the quote endpoint
+rate_table = RateTable()
+
 # Custom exception handler for validation errors
 
 
@@ -137,6 +162,7 @@ def create_car(car: schemas.CarCreate, db: Session = Depends(get_db)):
         db.add(db_car)
         db.commit()
         db.refresh(db_car)
+        rate_table.invalidate()
         return db_car
     except IntegrityError as e:
         db.rollback()
@@ -156,14 +182,20 @@ def create_car(car: schemas.CarCreate, db: Session = Depends(get_db)):
 
 
 @app.get("/cars/", tags=["Cars"], response_model=List[schemas.Car])
-def read_cars(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    cars = db.query(models.Car).offset(skip).limit(limit).all()
+def read_cars(skip: int = 0, limit: int = 100, db: Session = Depends(get_read_db)):
+    cars = db.execute(queries.select_page(
+        models.Car.__table__, skip, limit)).mappings().all()
     return cars
 
 
+@app.get("/cars/batch", tags=["Cars"], response_model=List[schemas.Car])
+def read_cars_batch(ids: List[int] = Query(..., max_length=500)):
+    return car_loader.load_many(ids)
+
+
 @app.get("/cars/{car_id}", tags=["Cars"], response_model=schemas.Car)
-def read_car(car_id: int, db: Session = Depends(get_db)):
-    car = db.query(models.Car).filter(models.Car.id == car_id).first()
+def read_car(car_id: int):
+    car = car_loader.load(car_id)
     if car is None:
         raise HTTPException(status_code=404, detail="Car not found")
     return car
@@ -178,6 +210,7 @@ def update_car(car_id: int, car_update: schemas.CarUpdate, db: Session = Depends
         setattr(car, key, value)
     db.commit()
     db.refresh(car)
+    rate_table.invalidate()
     return car
 
 
@@ -188,6 +221,7 @@ def delete_car(car_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Car not found")
     db.delete(car)
     db.commit()
+    rate_table.invalidate()
 
 # ---------------------------
 # Client Endpoints
@@ -204,15 +238,20 @@ def create_client(client: schemas.ClientCreate, db: Session = Depends(get_db)):
 
 
 @app.get("/clients/", tags=["Clients"], response_model=List[schemas.Client])
-def read_clients(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    clients = db.query(models.Client).offset(skip).limit(limit).all()
+def read_clients(skip: int = 0, limit: int = 100, db: Session = Depends(get_read_db)):
+    clients = db.execute(queries.select_page(
+        models.Client.__table__, skip, limit)).mappings().all()
     return clients
 
 
+@app.get("/clients/batch", tags=["Clients"], response_model=List[schemas.Client])
+def read_clients_batch(ids: List[int] = Query(..., max_length=500)):
+    return client_loader.load_many(ids)
+
+
 @app.get("/clients/{client_id}", tags=["Clients"], response_model=schemas.Client)
-def read_client(client_id: int, db: Session = Depends(get_db)):
-    client = db.query(models.Client).filter(
-        models.Client.id == client_id).first()
+def read_client(client_id: int):
+    client = client_loader.load(client_id)
     if client is None:
         raise HTTPException(status_code=404, detail="Client not found")
     return client
@@ -256,14 +295,16 @@ def create_order(order: schemas.OrderCreate, db: Session = Depends(get_db)):
 
 
 @app.get("/orders/", tags=["Orders"], response_model=List[schemas.Order])
-def read_orders(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    orders = db.query(models.Order).offset(skip).limit(limit).all()
+def read_orders(skip: int = 0, limit: int = 100, db: Session = Depends(get_read_db)):
+    orders = db.execute(queries.select_page(
+        models.Order.__table__, skip, limit)).mappings().all()
     return orders
 
 
 @app.get("/orders/{order_id}", tags=["Orders"], response_model=schemas.Order)
-def read_order(order_id: int, db: Session = Depends(get_db)):
-    order = db.query(models.Order).filter(models.Order.id == order_id).first()
+def read_order(order_id: int, db: Session = Depends(get_read_db)):
+    order = db.execute(queries.select_by_id(
+        models.Order.__table__, order_id)).mappings().first()
     if order is None:
         raise HTTPException(status_code=404, detail="Order not found")
     return order
@@ -290,6 +331,16 @@ def delete_order(order_id: int, db: Session = Depends(get_db)):
     db.commit()
     return {"detail": "Order deleted"}
 
+# ---------------------------
+# Quote Endpoints
+# ---------------------------
+
+
+@app.post("/quotes/", tags=["Quotes"], response_model=List[schemas.Quote])
+def create_quotes(quote_request: schemas.QuoteRequest, db: Session = Depends(get_read_db)):
+    return rate_table.quote(db, quote_request.car_ids,
+                            quote_request.start_date, quote_request.end_date)
+
 
 # ---------------------------
 # Insurance Endpoints
@@ -305,15 +356,16 @@ def create_insurance(insurance: schemas.InsuranceCreate, db: Session = Depends(g
 
 
 @app.get("/insurances/", tags=["Insurances"], response_model=List[schemas.Insurance])
-def read_insurances(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    insurances = db.query(models.Insurance).offset(skip).limit(limit).all()
+def read_insurances(skip: int = 0, limit: int = 100, db: Session = Depends(get_read_db)):
+    insurances = db.execute(queries.select_page(
+        models.Insurance.__table__, skip, limit)).mappings().all()
     return insurances
 
 
 @app.get("/insurances/{insurance_id}", tags=["Insurances"], response_model=schemas.Insurance)
-def read_insurance(insurance_id: int, db: Session = Depends(get_db)):
-    insurance = db.query(models.Insurance).filter(
-        models.Insurance.id == insurance_id).first()
+def read_insurance(insurance_id: int, db: Session = Depends(get_read_db)):
+    insurance = db.execute(queries.select_by_id(
+        models.Insurance.__table__, insurance_id)).mappings().first()
     if insurance is None:
         raise HTTPException(status_code=404, detail="Insurance not found")
     return insurance
@@ -0,0 +1,120 @@
+import calendar
+import math
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+import models
+
+
+# pricing.py
+
+# Base daily rate per vehicle type, before age and kilometer adjustments
+BASE_DAILY_RATES = {
+    'SUV': 250.0,
+    'Sedan': 180.0,
+    'Hatchback': 150.0,
+    'Coupe': 220.0,
+    'Convertible': 280.0,
+    'Van': 260.0,
+    'Pickup': 240.0,
+}
+DEFAULT_DAILY_RATE = 200.0
+
+# Multiplier applied to each rental day, indexed by month (January first)
+SEASONAL_MULTIPLIERS = (
+    0.85, 0.85, 0.95, 1.00, 1.05, 1.20,
+    1.35, 1.35, 1.10, 1.00, 0.90, 1.15,
+)
+
+AGE_DISCOUNT_PER_YEAR = 0.03
+MIN_AGE_FACTOR = 0.60
+KILOMETER_DISCOUNT_PER_50K = 0.05
+MIN_KILOMETER_FACTOR = 0.70
+
+
+def car_daily_rate(vehicle_type: str, year: int, kilometers: Optional[int], today: Optional[date] = None) -> float:
+    today = today or date.today()
+    base = BASE_DAILY_RATES.get(vehicle_type, DEFAULT_DAILY_RATE)
+    age = max(today.year - year, 0)
+    age_factor = max(1 - AGE_DISCOUNT_PER_YEAR * age, MIN_AGE_FACTOR)
+    kilometer_factor = max(
+        1 - KILOMETER_DISCOUNT_PER_50K * ((kilometers or 0) // 50000), MIN_KILOMETER_FACTOR)
+    return base * age_factor * kilometer_factor
+
+
+def rental_days(start_date: datetime, end_date: datetime) -> int:
+    # Every started day is billed as a full day
+    return max(math.ceil((end_date - start_date) / timedelta(days=1)), 1)
+
+
+def season_factor(start_date: datetime, days: int) -> float:
+    # Sum of the seasonal multipliers over every billed day, walked a month
+    # at a time, so the same value prices every car in a quote
+    factor = 0.0
+    day = start_date.date()
+    while True:
+        days_in_month = calendar.monthrange(day.year, day.month)[1]
+        span = min(days_in_month - day.day + 1, days)
+        factor += SEASONAL_MULTIPLIERS[day.month - 1] * span
+        days -= span
+        if days <= 0:
+            # Stop before stepping past the last billed day, which may be
+            # date.max
+            return factor
+        day += timedelta(days=span)
+
+
+class RateTable:
+    """In-memory daily rate per car, rebuilt from the cars table.
+
+    Rates are precomputed once per refresh so a quote for hundreds of cars
+    is a dictionary lookup and one multiplication per car. The table is
+    rebuilt after ``ttl`` seconds or when a car is created, updated or
+    deleted.
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._rates: Dict[int, float] = {}
+        self._loaded_at: Optional[float] = None
+
+    def invalidate(self):
+        with self._lock:
+            self._loaded_at = None
+
+    def rates(self, db) -> Dict[int, float]:
+        with self._lock:
+            if self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl:
+                self._rates = self._load(db)
+                self._loaded_at = time.monotonic()
+            return self._rates
+
+    def quote(self, db, car_ids: List[int], start_date: datetime, end_date: datetime) -> List[dict]:
+        rates = self.rates(db)
+        days = rental_days(start_date, end_date)
+        factor = season_factor(start_date, days)
+        quotes = []
+        for car_id in dict.fromkeys(car_ids):
+            daily_rate = rates.get(car_id)
+            if daily_rate is None:
+                continue
+            quotes.append({
+                "car_id": car_id,
+                "days": days,
+                "daily_rate": round(daily_rate, 2),
+                "total_amount": round(daily_rate * factor, 2),
+            })
+        return quotes
+
+    @staticmethod
+    def _load(db) -> Dict[int, float]:
+        today = date.today()
+        rows = db.query(models.Car.id, models.Car.vehicle_type,
+                        models.Car.year, models.Car.kilometers).all()
+        return {
+            car_id: car_daily_rate(vehicle_type, year, kilometers, today)
+            for car_id, vehicle_type, year, kilometers in rows
+        }
@@ -0,0 +1,23 @@
+from sqlalchemy import Table, lambda_stmt, select
+from typing import List
+
+
+# queries.py
+
+# Statements for the read-only endpoints. Wrapping them in lambda_stmt lets
+# SQLAlchemy cache the compiled SQL per table; the arguments become bound
+# parameters instead of triggering a rebuild on every request. Selecting the
+# table rather than the mapped class returns plain rows, skipping ORM
+# instance hydration for results that are serialized and thrown away.
+
+
+def select_page(table: Table, skip: int, limit: int):
+    return lambda_stmt(lambda: select(table).offset(skip).limit(limit))
+
+
+def select_by_id(table: Table, row_id: int):
+    return lambda_stmt(lambda: select(table).where(table.c.id == row_id))
+
+
+def select_by_ids(table: Table, row_ids: List[int]):
+    return lambda_stmt(lambda: select(table).where(table.c.id.in_(row_ids)))
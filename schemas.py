@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from datetime import date, datetime
+from pydantic import BaseModel, Field, model_validator
+from datetime import date, datetime, timedelta
 from typing import Optional, List
 
 
@@ -175,3 +175,40 @@ class Insurance(InsuranceBase):
 
     class Config:
         orm_mode = True
+
+# ---------------------------
+# Quote Schemas
+# ---------------------------
+
+MAX_RENTAL_DAYS = 365
+
+
+class QuoteRequest(BaseModel):
+    car_ids: List[int] = Field(...,
+                               description="IDs of the cars to price.", min_length=1, max_length=500)
+    start_date: datetime = Field(...,
+                                 description="Start date and time of the rental.")
+    end_date: datetime = Field(...,
+                               description="End date and time of the rental.")
+
+    @model_validator(mode='after')
+    def check_dates(self):
+        # Naive and aware datetimes cannot be compared or subtracted
+        if (self.start_date.tzinfo is None) != (self.end_date.tzinfo is None):
+            raise ValueError(
+                "Start date and end date must both include a timezone or both omit it.")
+        if self.end_date <= self.start_date:
+            raise ValueError("End date must be after start date.")
+        if self.end_date - self.start_date > timedelta(days=MAX_RENTAL_DAYS):
+            raise ValueError(
+                f"Rental period cannot exceed {MAX_RENTAL_DAYS} days.")
+        return self
+
+
+class Quote(BaseModel):
+    car_id: int = Field(..., description="ID of the priced car.")
+    days: int = Field(..., description="Number of billed rental days.")
+    daily_rate: float = Field(...,
+                              description="Car's daily rate before seasonal adjustment.")
+    total_amount: float = Field(...,
+                                description="Quoted total amount for the rental.")
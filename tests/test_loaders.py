@@ -0,0 +1,70 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import models
+from loaders import BatchLoader
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    models.Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with factory() as db:
+        db.add_all([
+            models.Car(manufacturer="Toyota", model="Corolla", year=2020, vehicle_type="Sedan",
+                       registration_number=f"WX{i:05d}", purchase_date=date(2020, 1, 1))
+            for i in range(1, 11)
+        ])
+        db.commit()
+    return factory
+
+
+def wait_until(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_load_returns_row_or_none(session_factory):
+    loader = BatchLoader(models.Car, session_factory)
+    assert loader.load(3)["registration_number"] == "WX00003"
+    assert loader.load(99) is None
+
+
+def test_lookups_during_in_flight_query_share_one_batch(session_factory):
+    release = threading.Event()
+    queried = []
+
+    def blocking_session_factory():
+        queried.append(True)
+        if len(queried) == 1:
+            release.wait(5)
+        return session_factory()
+
+    loader = BatchLoader(models.Car, blocking_session_factory)
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        first = pool.submit(loader.load, 1)
+        wait_until(lambda: loader._in_flight)
+        rest = [pool.submit(loader.load, key) for key in range(2, 11)]
+        wait_until(lambda: len(loader._pending) == 9)
+        release.set()
+        assert first.result()["id"] == 1
+        assert [future.result()["id"] for future in rest] == list(range(2, 11))
+
+    assert len(queried) == 2
+
+
+def test_load_many_keeps_request_order(session_factory):
+    loader = BatchLoader(models.Car, session_factory)
+    rows = loader.load_many([5, 2, 99, 5])
+    assert [row["id"] for row in rows] == [5, 2]
@@ -0,0 +1,42 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from pricing import SEASONAL_MULTIPLIERS, rental_days, season_factor
+from schemas import QuoteRequest
+
+
+def per_day_season_factor(start_date, days):
+    return sum(
+        SEASONAL_MULTIPLIERS[(start_date + timedelta(days=day)).month - 1]
+        for day in range(days)
+    )
+
+
+def test_season_factor_matches_per_day_sum():
+    rng = random.Random(0)
+    for _ in range(2000):
+        start_date = datetime(2000, 1, 1) + timedelta(
+            days=rng.randint(0, 10000), hours=rng.randint(0, 23))
+        days = rng.randint(1, 366)
+        assert season_factor(start_date, days) == pytest.approx(
+            per_day_season_factor(start_date, days))
+
+
+def test_season_factor_on_last_representable_day():
+    start_date = datetime(9999, 12, 31)
+    days = rental_days(start_date, datetime(9999, 12, 31, 5))
+    assert days == 1
+    assert season_factor(start_date, days) == SEASONAL_MULTIPLIERS[11]
+
+
+@pytest.mark.parametrize("start_date, end_date, message", [
+    ("2024-07-03T10:00", "2024-07-01T10:00", "End date must be after start date."),
+    ("2024-07-01T10:00:00Z", "2024-07-03T11:00:00", "both include a timezone"),
+    ("2024-01-01T00:00", "2025-06-01T00:00", "cannot exceed 365 days"),
+])
+def test_quote_request_rejects_invalid_dates(start_date, end_date, message):
+    with pytest.raises(ValidationError, match=message):
+        QuoteRequest(car_ids=[1], start_date=start_date, end_date=end_date)